@@ -2,6 +2,7 @@ import os
 import json
 import shutil
 import threading
+import time
 from datetime import datetime
 from kivy.clock import Clock
 
@@ -12,6 +13,12 @@ try:
 except ImportError:
     ANDROID = False
 
+# Use orjson for the metadata file when it is available (C implementation)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Try to import audio metadata libraries
 try:
     import mutagen
@@ -287,68 +294,117 @@ class AudioVaultCore:
         """
         def process_file():
             try:
-                if not self.is_audio_file(source_path):
-                    result = {'success': False, 'error': 'Not a valid audio file'}
-                    if callback:
-                        Clock.schedule_once(lambda dt: callback(result), 0)
-                    return
-                
-                # Generate unique ID and filename
-                audio_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
-                original_filename = os.path.basename(source_path)
-                file_extension = os.path.splitext(original_filename)[1]
-                
-                # Create secure filename
-                vault_filename = f"audio_{audio_id}{file_extension}"
-                vault_path = os.path.join(self.vault_dir, vault_filename)
-                
-                # Copy file to vault (preserving original)
-                shutil.move(source_path, vault_path)
-                
-                # Extract metadata
-                metadata = self.extract_audio_metadata(vault_path)
-                
-                # Extract album art
-                thumbnail_path = self.extract_album_art(vault_path, audio_id)
-                
-                # Create file record
-                file_record = {
-                    'id': audio_id,
-                    'original_filename': original_filename,
-                    'vault_filename': vault_filename,
-                    'vault_path': vault_path,
-                    'added_date': datetime.now().isoformat(),
-                    'metadata': metadata,
-                    'thumbnail_path': thumbnail_path,
-                    'tags': []  # User can add custom tags later
-                }
-                
-                # Add to metadata
-                self.metadata[audio_id] = file_record
-                self.save_metadata()
-                
-                print(f"✅ Audio file added: {original_filename}")
-                
-                result = {
-                    'success': True,
-                    'audio_id': audio_id,
-                    'file_record': file_record
-                }
-                
-                if callback:
-                    Clock.schedule_once(lambda dt: callback(result), 0)
+                result = self._import_audio_file(source_path)
+                if result['success']:
+                    self.save_metadata()
                     
             except Exception as e:
                 print(f"❌ Error adding audio file: {e}")
                 result = {'success': False, 'error': str(e)}
-                if callback:
-                    Clock.schedule_once(lambda dt: callback(result), 0)
+            
+            if callback:
+                Clock.schedule_once(lambda dt: callback(result), 0)
         
         # Process in background thread
         thread = threading.Thread(target=process_file)
         thread.daemon = True
         thread.start()
     
+    def add_audio_files(self, source_paths, progress_callback=None, callback=None):
+        """
+        Add many audio files to vault in one background pass, saving metadata every
+        few files instead of after each one
+        
+        progress_callback(index, source_path) runs on the main thread before each file,
+        callback(results) once at the end with one result dict per source path
+        """
+        source_paths = list(source_paths)
+        
+        def process_files():
+            results = []
+            unsaved = 0
+            last_save = time.monotonic()
+            
+            for index, source_path in enumerate(source_paths):
+                if progress_callback:
+                    Clock.schedule_once(lambda dt, i=index, p=source_path: progress_callback(i, p), 0)
+                
+                try:
+                    results.append(self._import_audio_file(source_path))
+                except Exception as e:
+                    print(f"❌ Error adding audio file: {e}")
+                    results.append({'success': False, 'error': str(e)})
+                    continue
+                
+                # Files are already moved at this point - save now and then so a crash
+                # mid-batch orphans at most a few of them
+                if results[-1]['success']:
+                    unsaved += 1
+                    if unsaved >= 10 or time.monotonic() - last_save >= 2:
+                        self.save_metadata()
+                        unsaved = 0
+                        last_save = time.monotonic()
+            
+            if unsaved:
+                self.save_metadata()
+            
+            if callback:
+                Clock.schedule_once(lambda dt: callback(results), 0)
+        
+        # Process in background thread
+        thread = threading.Thread(target=process_files)
+        thread.daemon = True
+        thread.start()
+    
+    def _import_audio_file(self, source_path):
+        """Move one audio file into vault and record it (the caller saves metadata)"""
+        if not self.is_audio_file(source_path):
+            return {'success': False, 'error': 'Not a valid audio file'}
+        
+        # Generate unique ID and filename
+        audio_id = datetime.now().strftime("%Y%m%d_%H%M%S_%f")
+        if audio_id in self.metadata:
+            # Batch imports can land on the same clock tick (coarse timers on Windows)
+            audio_id = f"{audio_id}_{os.urandom(2).hex()}"
+        original_filename = os.path.basename(source_path)
+        file_extension = os.path.splitext(original_filename)[1]
+        
+        # Create secure filename
+        vault_filename = f"audio_{audio_id}{file_extension}"
+        vault_path = os.path.join(self.vault_dir, vault_filename)
+        
+        # Copy file to vault (preserving original)
+        shutil.move(source_path, vault_path)
+        
+        # Extract metadata
+        metadata = self.extract_audio_metadata(vault_path)
+        
+        # Extract album art
+        thumbnail_path = self.extract_album_art(vault_path, audio_id)
+        
+        # Create file record
+        file_record = {
+            'id': audio_id,
+            'original_filename': original_filename,
+            'vault_filename': vault_filename,
+            'vault_path': vault_path,
+            'added_date': datetime.now().isoformat(),
+            'metadata': metadata,
+            'thumbnail_path': thumbnail_path,
+            'tags': []  # User can add custom tags later
+        }
+        
+        # Add to metadata
+        self.metadata[audio_id] = file_record
+        
+        print(f"✅ Audio file added: {original_filename}")
+        
+        return {
+            'success': True,
+            'audio_id': audio_id,
+            'file_record': file_record
+        }
+    
     def get_audio_files(self, search_query=None, sort_by='added_date'):
         """
         Get list of audio files with optional search and sorting
@@ -552,9 +608,11 @@ class AudioVaultCore:
     def load_metadata(self):
         """Load metadata from JSON file"""
         try:
-            if os.path.exists(self.metadata_file):
-                with open(self.metadata_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
+            with open(self.metadata_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if orjson else json.loads(data.decode('utf-8'))
+        except FileNotFoundError:
+            # Empty vault - no metadata written yet
             return {}
         except Exception as e:
             print(f"❌ Error loading metadata: {e}")
@@ -563,8 +621,13 @@ class AudioVaultCore:
     def save_metadata(self):
         """Save metadata to JSON file"""
         try:
-            with open(self.metadata_file, 'w', encoding='utf-8') as f:
-                json.dump(self.metadata, f, indent=2, ensure_ascii=False)
+            if orjson:
+                data = orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.metadata, indent=2, ensure_ascii=False).encode('utf-8')
+            
+            with open(self.metadata_file, 'wb') as f:
+                f.write(data)
         except Exception as e:
             print(f"❌ Error saving metadata: {e}")
 
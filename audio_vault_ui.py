@@ -479,8 +479,6 @@ class AudioVaultWidget(BoxLayout):
     def add_audio_files(self, file_paths):
         """Add multiple audio files with progress tracking"""
         total_files = len(file_paths)
-        completed_files = 0
-        failed_files = []
         
         # Create progress popup
         progress_content = BoxLayout(orientation='vertical', spacing=15, padding=15)
@@ -510,36 +508,25 @@ class AudioVaultWidget(BoxLayout):
         )
         progress_popup.open()
         
-        def process_next_file(file_index=0):
-            if file_index >= total_files:
-                # All files processed
-                progress_popup.dismiss()
-                self.refresh_audio_vault()
-                self.show_add_results(total_files, len(failed_files), failed_files)
-                return
-            
-            file_path = file_paths[file_index]
-            filename = os.path.basename(file_path)
-            
+        def on_progress(file_index, file_path):
             # Update progress
-            self.progress_label.text = f'📁 Adding audio files...\n{completed_files} of {total_files} completed'
-            self.current_file_label.text = f'Processing: {filename}'
+            self.progress_label.text = f'📁 Adding audio files...\n{file_index} of {total_files} completed'
+            self.current_file_label.text = f'Processing: {os.path.basename(file_path)}'
+        
+        def on_files_added(results):
+            # All files processed
+            failed_files = [
+                {'file': os.path.basename(file_path), 'error': result['error']}
+                for file_path, result in zip(file_paths, results)
+                if not result['success']
+            ]
             
-            def on_file_added(result):
-                nonlocal completed_files
-                completed_files += 1
-                
-                if not result['success']:
-                    failed_files.append({'file': filename, 'error': result['error']})
-                
-                # Process next file
-                Clock.schedule_once(lambda dt: process_next_file(file_index + 1), 0.1)
-            
-            # Add file asynchronously
-            self.audio_vault.add_audio_file(file_path, on_file_added)
+            progress_popup.dismiss()
+            self.refresh_audio_vault()
+            self.show_add_results(total_files, len(failed_files), failed_files)
         
-        # Start processing
-        Clock.schedule_once(lambda dt: process_next_file(), 0.1)
+        # Add all files in one background batch (metadata is saved once at the end)
+        self.audio_vault.add_audio_files(file_paths, on_progress, on_files_added)
     
     def show_add_results(self, total, failed_count, failed_files):
         """Show results of adding audio files"""
@@ -381,11 +381,17 @@ class DocumentVaultCore:
             for category in categories_to_check:
                 category_dir = os.path.join(self.vault_dir, category)
                 
-                if os.path.exists(category_dir):
-                    for filename in os.listdir(category_dir):
-                        file_path = os.path.join(category_dir, filename)
+                try:
+                    entries = os.scandir(category_dir)
+                except FileNotFoundError:
+                    continue
+                
+                with entries:
+                    for entry in entries:
+                        filename = entry.name
+                        file_path = entry.path
                         
-                        if os.path.isfile(file_path):
+                        if entry.is_file():
                             try:
                                 # Extract original filename from vault filename
                                 # Extract original filename using regex
@@ -396,8 +402,8 @@ class DocumentVaultCore:
                                 else:
                                     original_name = filename
                                 
-                                # Get file info
-                                stat = os.stat(file_path)
+                                # Get file info (cached on the entry on Windows)
+                                stat = entry.stat()
                                 
                                 documents.append({
                                     'path': file_path,
@@ -3,6 +3,7 @@ import shutil
 import threading
 import re
 import mimetypes
+import time
 from datetime import datetime
 from kivy.clock import Clock
 from PIL import Image as PILImage
@@ -34,6 +35,7 @@ class PhotoVaultCore:
         self.vault_dir = self.get_vault_directory()
         self.ensure_vault_directory()
         self.processing = False  # Flag to prevent multiple operations
+        self._photo_list_cache = (None, [])  # (vault folder signature, sorted photo paths)
         
         # Initialize MIME types for better detection
         mimetypes.init()
@@ -70,7 +72,8 @@ class PhotoVaultCore:
                 with PILImage.open(file_path) as img:
                     img.verify()
                 return True
-        except:
+        except Exception:
+            # Unreadable or corrupt images raise a variety of errors from PIL
             pass
         return False
     
@@ -248,18 +251,49 @@ class PhotoVaultCore:
     def finish_import(self, imported_files, skipped_files, callback):
         """Finish import process on main thread"""
         self.processing = False
+        self._photo_list_cache = (None, [])  # Copies finished after the last listing
         callback(imported_files, skipped_files)
     
     def get_vault_photos(self):
         """Get list of all photos in vault using universal image detection"""
-        photos = []
         try:
-            if os.path.exists(self.vault_dir):
-                for filename in os.listdir(self.vault_dir):
-                    file_path = os.path.join(self.vault_dir, filename)
-                    if os.path.isfile(file_path) and self.is_image_file(file_path):
-                        photos.append(file_path)
-            return sorted(photos, key=lambda x: os.path.getmtime(x) if os.path.exists(x) else 0, reverse=True)
+            # Adding, removing or renaming a photo updates the folder's mtime - while it is
+            # unchanged, reuse the last listing instead of re-checking every file with PIL
+            try:
+                dir_stat = os.stat(self.vault_dir)
+            except FileNotFoundError:
+                return []
+            signature = (dir_stat.st_mtime_ns, dir_stat.st_size)
+            cached_signature, cached_photos = self._photo_list_cache
+            if signature == cached_signature:
+                return list(cached_photos)
+            
+            # A folder changed within the last 2s may still be mid-copy (or on a filesystem with
+            # coarse timestamps), and finishing a write doesn't touch its mtime - don't cache it
+            cacheable = time.time() - dir_stat.st_mtime >= 2
+            
+            # scandir gives the file type from the directory listing and keeps the stat for sorting
+            try:
+                entries = os.scandir(self.vault_dir)
+            except FileNotFoundError:
+                return []
+            
+            photos = []
+            with entries:
+                for entry in entries:
+                    if not (entry.is_file() and self.is_image_file(entry.path)):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue  # Deleted or recycled while listing
+                    photos.append((mtime, entry.path))
+            
+            photos.sort(key=lambda item: item[0], reverse=True)
+            photos = [path for _, path in photos]
+            
+            self._photo_list_cache = (signature, photos) if cacheable else (None, [])
+            return list(photos)
         except Exception as e:
             print(f"Error getting vault photos: {e}")
             return []
@@ -295,6 +329,8 @@ class PhotoVaultCore:
         except Exception as e:
             print(f"❌ Error moving photo to recycle bin: {e}")
             return False
+        finally:
+            self._photo_list_cache = (None, [])
     
     def export_photo(self, photo_path, user_selected_folder=None):
         """Export photo to user-selected location"""
@@ -2,6 +2,7 @@ import os
 import json
 import shutil
 import threading
+import time
 from datetime import datetime, timedelta
 from kivy.clock import Clock
 
@@ -12,6 +13,12 @@ try:
 except ImportError:
     ANDROID = False
 
+# Use orjson for the metadata file when it is available (C implementation)
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class RecycleBinCore:
     """
     Flexible Recycle Bin System for Secret Vault App
@@ -155,12 +162,14 @@ class RecycleBinCore:
             shutil.move(file_path, recycled_path)
             
             # Store metadata
+            deleted_at = datetime.now()
             recycled_info = {
                 'original_path': file_path,
                 'original_location': original_location or os.path.dirname(file_path),
                 'recycled_path': recycled_path,
                 'file_type': file_type,
-                'deleted_at': datetime.now().isoformat(),
+                'deleted_at': deleted_at.isoformat(),
+                'deleted_ts': int(deleted_at.timestamp()),
                 'size': os.path.getsize(recycled_path),
                 'metadata': metadata or {}
             }
@@ -416,12 +425,11 @@ class RecycleBinCore:
     def get_days_remaining(self, recycled_info):
         """Get days remaining before permanent deletion"""
         try:
-            deleted_at = datetime.fromisoformat(recycled_info['deleted_at'])
             file_type = recycled_info['file_type']
             retention_days = self.FILE_TYPE_CONFIG[file_type]['retention_days']
             
-            expiry_date = deleted_at + timedelta(days=retention_days)
-            days_remaining = (expiry_date - datetime.now()).days
+            expiry_ts = recycled_info['deleted_ts'] + retention_days * 86400
+            days_remaining = int((expiry_ts - time.time()) // 86400)
             
             return max(0, days_remaining)
             
@@ -467,6 +475,36 @@ class RecycleBinCore:
             print(f"Error getting recycle bin stats: {e}")
             return {'total_files': 0, 'total_size_mb': 0, 'by_type': {}}
     
+    def get_stats_rows(self):
+        """
+        Get recycle bin statistics in a single pass over the metadata
+        
+        Returns:
+            tuple: (total_files, total_size_mb, rows) where rows holds one compact
+                   (icon, display_name, count, size_mb) tuple per file type
+        """
+        try:
+            counts = dict.fromkeys(self.FILE_TYPE_CONFIG, 0)
+            sizes = dict.fromkeys(self.FILE_TYPE_CONFIG, 0)
+            
+            for info in self.metadata.values():
+                file_type = info['file_type']
+                counts[file_type] += 1
+                sizes[file_type] += info.get('size', 0)
+            
+            rows = [
+                (config['icon'], config['display_name'], counts[file_type],
+                 round(sizes[file_type] / (1024 * 1024), 1))
+                for file_type, config in self.FILE_TYPE_CONFIG.items()
+            ]
+            total_size_mb = round(sum(sizes.values()) / (1024 * 1024), 1)
+            
+            return len(self.metadata), total_size_mb, rows
+            
+        except Exception as e:
+            print(f"Error getting recycle bin stats rows: {e}")
+            return 0, 0, []
+    
     def empty_recycle_bin(self, file_type=None):
         """Empty recycle bin (all files or specific type)"""
         try:
@@ -491,9 +529,27 @@ class RecycleBinCore:
     def load_metadata(self):
         """Load metadata from JSON file"""
         try:
-            if os.path.exists(self.metadata_file):
-                with open(self.metadata_file, 'r') as f:
-                    return json.load(f)
+            with open(self.metadata_file, 'rb') as f:
+                data = f.read()
+            metadata = orjson.loads(data) if orjson else json.loads(data)
+            
+            # Backfill Unix timestamps for entries recycled before 'deleted_ts' existed
+            # One per entry, so a single malformed entry can't take the whole bin with it
+            for info in metadata.values():
+                if not isinstance(info, dict) or 'deleted_ts' in info:
+                    continue
+                try:
+                    info['deleted_ts'] = int(datetime.fromisoformat(info['deleted_at']).timestamp())
+                except (KeyError, TypeError, ValueError):
+                    # No usable 'deleted_at' - the recycled file's mtime is the next best guess
+                    try:
+                        info['deleted_ts'] = int(os.path.getmtime(info['recycled_path']))
+                    except (KeyError, TypeError, OSError):
+                        info['deleted_ts'] = 0
+            
+            return metadata
+        except FileNotFoundError:
+            # First run - nothing recycled yet
             return {}
         except Exception as e:
             print(f"Error loading metadata: {e}")
@@ -502,8 +558,16 @@ class RecycleBinCore:
     def save_metadata(self):
         """Save metadata to JSON file"""
         try:
-            with open(self.metadata_file, 'w') as f:
-                json.dump(self.metadata, f, indent=2)
+            if orjson:
+                data = orjson.dumps(self.metadata, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(self.metadata, indent=2).encode('utf-8')
+            
+            # Write to a temp file and rename over the old one, so a crash never leaves a torn file
+            temp_file = self.metadata_file + '.tmp'
+            with open(temp_file, 'wb') as f:
+                f.write(data)
+            os.replace(temp_file, self.metadata_file)
         except Exception as e:
             print(f"Error saving metadata: {e}")
     
@@ -1,5 +1,6 @@
 import os
-from datetime import datetime
+import time
+from functools import lru_cache, partial
 from kivy.uix.boxlayout import BoxLayout
 from kivy.uix.gridlayout import GridLayout
 from kivy.uix.button import Button
@@ -9,19 +10,156 @@ from kivy.uix.popup import Popup
 from kivy.uix.spinner import Spinner
 from kivy.clock import Clock
 from kivy.metrics import dp
+from kivy.lang import Builder
+from kivy.properties import StringProperty, ColorProperty
 
 from recycle_bin_core import RecycleBinCore
 
+@lru_cache(maxsize=4096)
+def _format_minute(minute):
+    """Format a Unix time in minutes as 'YYYY-MM-DD HH:MM' (bulk deletes share minutes)"""
+    return time.strftime("%Y-%m-%d %H:%M", time.localtime(minute * 60))
+
+def _format_deleted_time(timestamp):
+    """Format a deletion Unix timestamp for display"""
+    return _format_minute(int(timestamp) // 60)
+
+# Row layout for recycled files - parsed once at import instead of building
+# every sub-widget in Python for each row
+Builder.load_string("""
+<FileRow>:
+    orientation: 'horizontal'
+    size_hint_y: None
+    height: dp(80)
+    padding: 5
+    spacing: 10
+    canvas.before:
+        Color:
+            rgba: self.bg_color
+        Rectangle:
+            pos: self.pos
+            size: self.size
+    
+    BoxLayout:
+        orientation: 'vertical'
+        size_hint_x: 0.7
+        
+        BoxLayout:
+            orientation: 'horizontal'
+            size_hint_y: 0.6
+            
+            Label:
+                text: root.icon
+                font_size: 24
+                size_hint_x: 0.1
+            
+            BoxLayout:
+                orientation: 'vertical'
+                size_hint_x: 0.9
+                
+                Label:
+                    text: root.display_name
+                    font_size: 14
+                    halign: 'left'
+                    color: 1, 1, 1, 1
+                    text_size: self.size
+                    shorten: True
+                    shorten_from: 'right'
+                    max_lines: 1
+                
+                Label:
+                    text: root.size_text
+                    font_size: 12
+                    halign: 'left'
+                    color: 0.7, 0.7, 0.7, 1
+                    text_size: self.size
+        
+        Label:
+            text: root.date_text
+            font_size: 11
+            halign: 'left'
+            color: root.date_color
+            text_size: self.size
+            size_hint_y: 0.4
+            shorten: True
+            max_lines: 1
+    
+    BoxLayout:
+        orientation: 'horizontal'
+        size_hint_x: 0.3
+        spacing: 5
+        
+        Button:
+            text: '📋\\nSelect'
+            font_size: 12
+            size_hint_x: 0.5
+            on_press: root.dispatch('on_select')
+        
+        Button:
+            text: '⚙️\\nOptions'
+            font_size: 12
+            size_hint_x: 0.5
+            on_press: root.dispatch('on_options')
+""")
+
+class FileRow(BoxLayout):
+    """
+    Lightweight row for a recycled file, laid out by the <FileRow> kv rule
+    Draws its background as a single rectangle; selection only changes its color
+    """
+    
+    NORMAL_COLOR = (0, 0, 0, 0)
+    SELECTED_COLOR = (0.2, 0.6, 0.8, 0.3)  # Light blue highlight
+    
+    icon = StringProperty('')
+    display_name = StringProperty('')
+    size_text = StringProperty('')
+    date_text = StringProperty('')
+    date_color = ColorProperty((0.7, 0.7, 0.7, 1))
+    bg_color = ColorProperty(NORMAL_COLOR)
+    
+    __events__ = ('on_select', 'on_options')
+    
+    def set_selected(self, selected):
+        """Toggle the selection highlight"""
+        self.bg_color = self.SELECTED_COLOR if selected else self.NORMAL_COLOR
+    
+    def on_select(self):
+        pass
+    
+    def on_options(self):
+        pass
+
 class RecycleBinWidget(BoxLayout):
     """
     Main Recycle Bin UI Widget - Flexible for all file types
     """
     
+    # Filter spinner values and display-name -> file type map, per config
+    _filter_options_cache = {}
+    
+    @classmethod
+    def _get_filter_options(cls, config):
+        """Get cached (spinner values, display name -> file type) for a file type config"""
+        # Include the size so types added via add_new_file_type() are picked up
+        key = (id(config), len(config))
+        cached = cls._filter_options_cache.get(key)
+        if cached is None:
+            display_to_type = {
+                f"{type_config['icon']} {type_config['display_name']}": file_type
+                for file_type, type_config in config.items()
+            }
+            cached = (['All Files', *display_to_type], display_to_type)
+            cls._filter_options_cache[key] = cached
+        return cached
+    
     def __init__(self, recycle_bin_core, **kwargs):
         super().__init__(orientation='vertical', **kwargs)
         self.recycle_bin = recycle_bin_core
         self.selected_file = None
+        self._selected_row = None
         self.current_filter = 'all'  # Current file type filter
+        self._empty_widget = None  # Reused empty-state widget
         
         # Create UI
         self.create_header()
@@ -79,10 +217,7 @@ class RecycleBinWidget(BoxLayout):
         filter_layout.add_widget(filter_label)
         
         # Create filter options dynamically from FILE_TYPE_CONFIG
-        filter_options = ['All Files']
-        for file_type, config in self.recycle_bin.FILE_TYPE_CONFIG.items():
-            display_name = f"{config['icon']} {config['display_name']}"
-            filter_options.append(display_name)
+        filter_options, _ = self._get_filter_options(self.recycle_bin.FILE_TYPE_CONFIG)
         
         self.filter_spinner = Spinner(
             text='All Files',
@@ -169,11 +304,9 @@ class RecycleBinWidget(BoxLayout):
             self.current_filter = 'all'
         else:
             # Extract file type from display text
-            for file_type, config in self.recycle_bin.FILE_TYPE_CONFIG.items():
-                display_name = f"{config['icon']} {config['display_name']}"
-                if text == display_name:
-                    self.current_filter = file_type
-                    break
+            _, display_to_type = self._get_filter_options(self.recycle_bin.FILE_TYPE_CONFIG)
+            if text in display_to_type:
+                self.current_filter = display_to_type[text]
         
         self.refresh_file_grid()
     
@@ -185,20 +318,18 @@ class RecycleBinWidget(BoxLayout):
     def update_stats(self):
         """Update statistics display"""
         try:
-            stats = self.recycle_bin.get_recycle_bin_stats()
+            # Totals and per-type rows come from one pass over the metadata
+            total_files, total_size_mb, rows = self.recycle_bin.get_stats_rows()
             
             # Create stats text
-            stats_text = f"📊 Total: {stats['total_files']} files ({stats['total_size_mb']} MB)\n"
+            stats_text = f"📊 Total: {total_files} files ({total_size_mb} MB)\n"
             
             # Add breakdown by type (only show non-zero counts)
-            type_breakdown = []
-            for file_type, type_stats in stats['by_type'].items():
-                if type_stats['count'] > 0:
-                    icon = type_stats['icon']
-                    name = type_stats['display_name']
-                    count = type_stats['count']
-                    size = type_stats['size_mb']
-                    type_breakdown.append(f"{icon} {name}: {count} ({size} MB)")
+            type_breakdown = [
+                f"{icon} {name}: {count} ({size} MB)"
+                for icon, name, count, size in rows
+                if count
+            ]
             
             if type_breakdown:
                 stats_text += " | ".join(type_breakdown)
@@ -214,9 +345,8 @@ class RecycleBinWidget(BoxLayout):
     def refresh_file_grid(self):
         """Refresh the file grid based on current filter"""
         try:
-            # Clear existing widgets
-            self.file_grid.clear_widgets()
             self.selected_file = None
+            self._selected_row = None
             
             # Get filtered files
             if self.current_filter == 'all':
@@ -225,18 +355,31 @@ class RecycleBinWidget(BoxLayout):
                 files = self.recycle_bin.get_recycled_files(self.current_filter)
             
             if not files:
-                # Show empty state
-                empty_widget = self.create_empty_state_widget()
-                self.file_grid.add_widget(empty_widget)
+                # Show empty state, reusing the cached widget
+                if self._empty_widget is None:
+                    self._empty_widget = self.create_empty_state_widget()
+                else:
+                    self._empty_label.text = self.get_empty_state_text()
+                
+                if self.file_grid.children != [self._empty_widget]:
+                    self.file_grid.clear_widgets()
+                    self.file_grid.add_widget(self._empty_widget)
                 return
             
-            # Create file widgets
-            for file_info in files:
-                file_widget = self.create_file_widget(file_info)
-                self.file_grid.add_widget(file_widget)
+            # Build all rows before touching the grid so it is swapped in
+            # one pass; the grid's layout trigger then runs once per frame
+            file_widgets = [self.create_file_widget(file_info) for file_info in files]
+            
+            # Clear existing widgets
+            self.file_grid.clear_widgets()
+            
+            add_widget = self.file_grid.add_widget
+            for file_widget in file_widgets:
+                add_widget(file_widget)
                 
         except Exception as e:
             print(f"Error refreshing file grid: {e}")
+            self.file_grid.clear_widgets()
             error_label = Label(
                 text=f"❌ Error loading files: {str(e)}",
                 size_hint_y=None,
@@ -254,83 +397,33 @@ class RecycleBinWidget(BoxLayout):
             padding=20
         )
         
-        filter_text = "this category" if self.current_filter != 'all' else "the recycle bin"
-        
         empty_label = Label(
-            text=f'🎉 No files in {filter_text}\n\nDeleted files will appear here and be\nautomatically cleaned up based on retention settings.',
+            text=self.get_empty_state_text(),
             font_size=16,
             halign='center',
             color=(0.6, 0.6, 0.6, 1)
         )
         empty_label.bind(size=empty_label.setter('text_size'))
         empty_layout.add_widget(empty_label)
+        self._empty_label = empty_label
         
         return empty_layout
     
+    def get_empty_state_text(self):
+        """Get empty state message for the current filter"""
+        filter_text = "this category" if self.current_filter != 'all' else "the recycle bin"
+        return f'🎉 No files in {filter_text}\n\nDeleted files will appear here and be\nautomatically cleaned up based on retention settings.'
+    
     def create_file_widget(self, file_info):
         """Create widget for individual recycled file"""
-        # Main container
-        file_layout = BoxLayout(
-            orientation='horizontal',
-            size_hint_y=None,
-            height=dp(80),
-            padding=5,
-            spacing=10
-        )
-        
-        # File type icon and info
-        info_layout = BoxLayout(orientation='vertical', size_hint_x=0.7)
-        
-        # Top row: Icon, name, size
-        top_row = BoxLayout(orientation='horizontal', size_hint_y=0.6)
-        
         file_type = file_info['file_type']
-        icon = self.recycle_bin.FILE_TYPE_CONFIG[file_type]['icon']
-        
-        icon_label = Label(
-            text=icon,
-            font_size=24,
-            size_hint_x=0.1
-        )
-        top_row.add_widget(icon_label)
-        
-        name_size_layout = BoxLayout(orientation='vertical', size_hint_x=0.9)
-        
-        # File name (truncated if too long)
-        display_name = file_info['display_name']
-        if len(display_name) > 40:
-            display_name = display_name[:37] + "..."
-        
-        name_label = Label(
-            text=display_name,
-            font_size=14,
-            halign='left',
-            color=(1, 1, 1, 1)
-        )
-        name_label.bind(size=name_label.setter('text_size'))
-        name_size_layout.add_widget(name_label)
+        type_config = self.recycle_bin.FILE_TYPE_CONFIG[file_type]
         
         # Size and type info
         size_mb = file_info['size'] / (1024 * 1024)
-        type_display = self.recycle_bin.FILE_TYPE_CONFIG[file_type]['display_name']
-        
-        size_label = Label(
-            text=f"{size_mb:.1f} MB • {type_display}",
-            font_size=12,
-            halign='left',
-            color=(0.7, 0.7, 0.7, 1)
-        )
-        size_label.bind(size=size_label.setter('text_size'))
-        name_size_layout.add_widget(size_label)
-        
-        top_row.add_widget(name_size_layout)
-        info_layout.add_widget(top_row)
         
-        # Bottom row: Deletion date and days remaining
-        bottom_row = BoxLayout(orientation='horizontal', size_hint_y=0.4)
-        
-        deleted_at = datetime.fromisoformat(file_info['deleted_at'])
-        deleted_date = deleted_at.strftime("%Y-%m-%d %H:%M")
+        # Deletion date and days remaining
+        deleted_date = _format_deleted_time(file_info['deleted_ts'])
         days_remaining = file_info['days_remaining']
         
         if days_remaining > 0:
@@ -340,57 +433,42 @@ class RecycleBinWidget(BoxLayout):
             remaining_text = f"⚠️ Deleted: {deleted_date} • EXPIRES SOON!"
             remaining_color = (1, 0.6, 0, 1)  # Orange warning
         
-        date_label = Label(
-            text=remaining_text,
-            font_size=11,
-            halign='left',
-            color=remaining_color
-        )
-        date_label.bind(size=date_label.setter('text_size'))
-        bottom_row.add_widget(date_label)
-        
-        info_layout.add_widget(bottom_row)
-        file_layout.add_widget(info_layout)
-        
-        # Action buttons
-        button_layout = BoxLayout(orientation='horizontal', size_hint_x=0.3, spacing=5)
-        
-        select_btn = Button(
-            text='📋\nSelect',
-            font_size=12,
-            size_hint_x=0.5
+        file_layout = FileRow(
+            icon=type_config['icon'],
+            display_name=file_info['display_name'],
+            size_text=f"{size_mb:.1f} MB • {type_config['display_name']}",
+            date_text=remaining_text,
+            date_color=remaining_color
         )
-        select_btn.bind(on_press=lambda x: self.select_file(file_info))
-        button_layout.add_widget(select_btn)
-        
-        options_btn = Button(
-            text='⚙️\nOptions',
-            font_size=12,
-            size_hint_x=0.5
+        file_layout.bind(
+            on_select=partial(self.select_file, file_info),
+            on_options=partial(self.show_file_options, file_info)
         )
-        options_btn.bind(on_press=lambda x: self.show_file_options(file_info))
-        button_layout.add_widget(options_btn)
-        
-        file_layout.add_widget(button_layout)
         
         # Add selection indicator
         if self.selected_file and self.selected_file['recycled_id'] == file_info['recycled_id']:
-            file_layout.canvas.before.clear()
-            from kivy.graphics import Color, Rectangle
-            with file_layout.canvas.before:
-                Color(0.2, 0.6, 0.8, 0.3)  # Light blue highlight
-                Rectangle(pos=file_layout.pos, size=file_layout.size)
+            file_layout.set_selected(True)
+            self._selected_row = file_layout
         
         return file_layout
     
-    def select_file(self, file_info):
-        """Select a file and refresh to show selection"""
+    def select_file(self, file_info, instance=None):
+        """Select a file and highlight its row"""
         self.selected_file = file_info
+        
+        # Move the highlight without rebuilding the grid
+        if self._selected_row is not None:
+            self._selected_row.set_selected(False)
+            self._selected_row = None
+        if isinstance(instance, FileRow):
+            self._selected_row = instance
+            self._selected_row.set_selected(True)
+        
         print(f"Selected file: {file_info['display_name']}")
         # Don't refresh the entire grid - just print confirmation
         print(f"✅ File selected: {file_info['recycled_id']}")
     
-    def show_file_options(self, file_info):
+    def show_file_options(self, file_info, instance=None):
         """Show detailed options for a specific file"""
         content = BoxLayout(orientation='vertical', spacing=10, padding=15)
         
@@ -403,7 +481,7 @@ class RecycleBinWidget(BoxLayout):
 
 📁 Type: {type_name}
 📊 Size: {file_info['size'] / (1024 * 1024):.1f} MB
-🕒 Deleted: {datetime.fromisoformat(file_info['deleted_at']).strftime("%Y-%m-%d %H:%M")}
+🕒 Deleted: {_format_deleted_time(file_info['deleted_ts'])}
 ⏰ Days Remaining: {file_info['days_remaining']}
 📍 Original Location: {file_info['original_location']}"""
         
@@ -815,9 +893,28 @@ Are you absolutely sure?"""
         """Go back to main vault screen"""
         print("Going back to main vault screen from recycle bin...")
         
+        app = self.recycle_bin.app
+        self.cleanup()
+        
         # Navigate back
-        if hasattr(self.recycle_bin.app, 'show_vault_main'):
-            self.recycle_bin.app.show_vault_main()
+        if hasattr(app, 'show_vault_main'):
+            app.show_vault_main()
+    
+    def cleanup(self):
+        """Release rows, cached widgets and button bindings so their textures can be freed"""
+        self.file_grid.clear_widgets()
+        self._empty_widget = None
+        self._empty_label = None
+        self._selected_row = None
+        self.selected_file = None
+        
+        self.filter_spinner.unbind(text=self.on_filter_changed)
+        self.cleanup_btn.unbind(on_press=self.manual_cleanup)
+        self.empty_btn.unbind(on_press=self.confirm_empty_all)
+        self.refresh_btn.unbind(on_press=self.refresh_recycle_bin)
+        self.restore_btn.unbind(on_press=self.restore_selected)
+        self.delete_btn.unbind(on_press=self.delete_selected_forever)
+        self.back_btn.unbind(on_press=self.back_to_vault)
 
 # Integration helper function
 def integrate_recycle_bin(vault_app):
@@ -1,71 +1,210 @@
 import os
 import sys
-import platform
-import json
-from pathlib import Path
+import logging
+import threading
+import time
+import types
 
-# Try to import Android-specific modules
-try:
-    from android.storage import app_storage_path
-    from jnius import autoclass, PythonJavaClass, java_method
-    ANDROID = True
-    
-    # Android app context for private directories
-    PythonActivity = autoclass('org.kivy.android.PythonActivity')
-    Context = autoclass('android.content.Context')
-    File = autoclass('java.io.File')
-    
-except ImportError:
-    ANDROID = False
+# Android-specific modules are resolved lazily by _detect_android() on the first
+# SecureStorage(), so importing this module never pays for the JNI class lookups
+ANDROID = None
+app_storage_path = None
+PythonActivity = None
+_android_lock = threading.Lock()
+
+log = logging.getLogger(__name__)
+
+# Folder layout shared by the vault and the recycle bin
+_CATEGORIES = ("photos", "videos", "notes", "audio", "documents", "apps", "other")
+_RECYCLE_EXTRAS = ("thumbnails",)
+
+def _system_name():
+    """Get the platform.system()-style OS name, importing platform only for unusual OSes"""
+    if sys.platform == "win32":
+        return "Windows"
+    if sys.platform == "darwin":
+        return "Darwin"
+    if sys.platform.startswith("linux"):
+        return "Linux"
+    
+    import platform
+    return platform.system()
+
+# Platform never changes during the process lifetime - resolve it once
+_PLATFORM = _system_name()
+_IS_WINDOWS = _PLATFORM == "Windows"
+_IS_MACOS = _PLATFORM == "Darwin"
+_IS_LINUX = _PLATFORM == "Linux"
+
+_PLATFORM_NAME = "macOS" if _IS_MACOS else _PLATFORM
+
+if _IS_WINDOWS:
+    import ctypes
+    from ctypes import wintypes
+    
+    # Own WinDLL instance so the argtypes below don't leak into ctypes.windll.kernel32 users
+    _kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    
+    _GetFileAttributesW = _kernel32.GetFileAttributesW
+    _GetFileAttributesW.argtypes = [wintypes.LPCWSTR]
+    _GetFileAttributesW.restype = wintypes.DWORD
+    
+    _SetFileAttributesW = _kernel32.SetFileAttributesW
+    _SetFileAttributesW.argtypes = [wintypes.LPCWSTR, wintypes.DWORD]
+    _SetFileAttributesW.restype = wintypes.BOOL
+
+_FILE_ATTRIBUTE_HIDDEN = 0x02
+_INVALID_FILE_ATTRIBUTES = 0xFFFFFFFF
+
+def _hide_path(path):
+    """Set the Windows hidden attribute on path, keeping its other attributes"""
+    attributes = _GetFileAttributesW(path)
+    if attributes == _INVALID_FILE_ATTRIBUTES:
+        return False
+    if attributes & _FILE_ATTRIBUTE_HIDDEN:
+        return True  # Already hidden, skip the write
+    return bool(_SetFileAttributesW(path, attributes | _FILE_ATTRIBUTE_HIDDEN))
+
+def _detect_android():
+    """Try to import Android-specific modules once and return the ANDROID flag"""
+    global ANDROID, app_storage_path, PythonActivity
+    
+    if ANDROID is not None:
+        return ANDROID
+    
+    with _android_lock:
+        if ANDROID is None:
+            try:
+                from android.storage import app_storage_path as _app_storage_path
+                from jnius import autoclass
+                
+                # Android app context for private directories
+                PythonActivity = autoclass('org.kivy.android.PythonActivity')
+                app_storage_path = _app_storage_path
+                ANDROID = True
+                
+            except ImportError:
+                ANDROID = False
+    
+    return ANDROID
+
+def _copy_file_data(source_path, target_path):
+    """Copy file contents only (no timestamps/flags), in-kernel where the platform allows it"""
+    copy_file_range = getattr(os, "copy_file_range", None)  # Linux, Python 3.8+
+    if copy_file_range is not None:
+        bytes_left = 0
+        try:
+            with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                size = os.fstat(src.fileno()).st_size
+                remaining = size
+                while remaining > 0:
+                    copied = copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        # Some filesystems report "unsupported" as 0 bytes at offset 0 (as shutil
+                        # assumes too) - use the fallback. Stopping later means a short copy.
+                        if remaining != size:
+                            bytes_left = remaining
+                        break
+                    remaining -= copied
+                else:
+                    return  # Every byte of the source was copied
+        except OSError:
+            pass  # e.g. cross-filesystem copy on older kernels
+        
+        if bytes_left:
+            raise OSError(f"Short copy of {source_path}: {bytes_left} of {size} bytes not copied")
+    
+    import shutil
+    shutil.copyfile(source_path, target_path)
 
 class SecureStorage:
     """
     Cross-platform secure storage for app-private directories
     Files stored here are only accessible by your app, not visible to users or file managers
     """
+    __slots__ = ('app_name', '_home', 'base_dir', 'vault_dir', 'recycle_dir', 'config_dir',
+                 '_vault_dirs', '_recycle_dirs', '_all_subdirs', '_verify_existing_perms',
+                 '_user_accessible_prefixes', '_is_user_accessible_cache',
+                 '_storage_usage_snapshot', '_storage_usage_cache_ttl', '_storage_usage_max_age',
+                 '_usage_compute_lock', '_security_recommendations')
     
     def __init__(self, app_name="SecretVault"):
+        _detect_android()
         self.app_name = app_name
-        self.base_dir = self.get_secure_base_directory()
+        self._home = os.path.expanduser("~")  # Resolved once, used by the directory helpers
+        self.base_dir = self._compute_base_directory()
         self.vault_dir = os.path.join(self.base_dir, "vault_data")
         self.recycle_dir = os.path.join(self.base_dir, "vault_recycle")
         self.config_dir = os.path.join(self.base_dir, "config")
         
+        # Per-type directories, joined once for the get_*_directory() lookups
+        self._vault_dirs = {c: os.path.join(self.vault_dir, c) for c in _CATEGORIES}
+        self._recycle_dirs = {c: os.path.join(self.recycle_dir, c) for c in _CATEGORIES + _RECYCLE_EXTRAS}
+        
+        # Every directory ensure_secure_directories() creates, parents first
+        self._all_subdirs = (
+            (self.base_dir, self.vault_dir, self.recycle_dir, self.config_dir)
+            + tuple(self._vault_dirs.values())
+            + tuple(self._recycle_dirs.values())
+        )
+        
+        # Re-apply permissions to directories that already exist (off by default:
+        # directories are created 0o700 and only fixed up on creation)
+        self._verify_existing_perms = False
+        
+        # These directories should NOT be easily browsable by users
+        self._user_accessible_prefixes = (
+            "/sdcard",
+            "/storage/emulated/0",
+            os.path.join(self._home, "Desktop"),
+            os.path.join(self._home, "Documents"),
+            os.path.join(self._home, "Downloads"),
+            os.getcwd()  # Current working directory
+        )
+        # base_dir never changes, so neither does the answer
+        self._is_user_accessible_cache = self.base_dir.startswith(self._user_accessible_prefixes)
+        
+        # Storage usage is cached as a read-only snapshot. Within the TTL it is returned as is;
+        # after that it is kept while the directory mtimes are unchanged, up to the max age.
+        # (usage, timestamp, signature) is published as one tuple so readers need no lock.
+        self._storage_usage_snapshot = (None, 0.0, None)
+        self._storage_usage_cache_ttl = 30  # seconds
+        self._storage_usage_max_age = 300  # seconds, upper bound even if no mtime changed
+        self._usage_compute_lock = threading.Lock()  # Only one thread walks the vault at a time
+        
+        # Recommendations only depend on the platform and base_dir
+        self._security_recommendations = self._compute_security_recommendations()
+        
         # Create all necessary directories
         self.ensure_secure_directories()
         
-        print(f"✅ Secure storage initialized")
-        print(f"📁 Base directory: {self.base_dir}")
-        print(f"🔒 Platform: {self.get_platform_name()}")
-        print(f"👤 User accessible: {self.is_user_accessible()}")
+        log.info("✅ Secure storage initialized")
+        log.info("📁 Base directory: %s", self.base_dir)
+        log.info("🔒 Platform: %s", self.get_platform_name())
+        log.info("👤 User accessible: %s", self.is_user_accessible())
     
     def get_platform_name(self):
         """Get current platform name"""
-        if ANDROID:
-            return "Android"
-        elif platform.system() == "Windows":
-            return "Windows"
-        elif platform.system() == "Darwin":
-            return "macOS"
-        elif platform.system() == "Linux":
-            return "Linux"
-        else:
-            return platform.system()
+        return "Android" if ANDROID else _PLATFORM_NAME
     
     def get_secure_base_directory(self):
         """Get OS-specific secure app-private directory"""
+        return self.base_dir
+    
+    def _compute_base_directory(self):
+        """Resolve the OS-specific secure app-private directory (called once from __init__)"""
         
         if ANDROID:
             return self.get_android_private_directory()
-        elif platform.system() == "Windows":
+        elif _IS_WINDOWS:
             return self.get_windows_private_directory()
-        elif platform.system() == "Darwin":  # macOS
+        elif _IS_MACOS:
             return self.get_macos_private_directory()
-        elif platform.system() == "Linux":
+        elif _IS_LINUX:
             return self.get_linux_private_directory()
         else:
             # Fallback to current directory (not secure)
-            print("⚠️ WARNING: Unsupported platform, using current directory")
+            log.warning("⚠️ WARNING: Unsupported platform, using current directory")
             return os.path.join(os.getcwd(), f".{self.app_name}_data")
     
     def get_android_private_directory(self):
@@ -79,16 +218,16 @@ class SecureStorage:
             files_dir = context.getFilesDir()
             private_dir = files_dir.getAbsolutePath()
             
-            print(f"📱 Android private storage: {private_dir}")
+            log.info("📱 Android private storage: %s", private_dir)
             return os.path.join(private_dir, self.app_name)
             
         except Exception as e:
-            print(f"⚠️ Android private dir error: {e}")
+            log.warning("⚠️ Android private dir error: %s", e)
             
             try:
                 # Method 2: Fallback to Kivy's app storage
                 return os.path.join(app_storage_path(), self.app_name)
-            except:
+            except Exception:
                 # Method 3: Last resort - internal storage
                 return f"/data/data/org.kivy.{self.app_name.lower()}/files"
     
@@ -99,43 +238,43 @@ class SecureStorage:
             appdata_local = os.environ.get('LOCALAPPDATA')
             if appdata_local:
                 private_dir = os.path.join(appdata_local, self.app_name)
-                print(f"🪟 Windows private storage: {private_dir}")
+                log.info("🪟 Windows private storage: %s", private_dir)
                 return private_dir
             
             # Method 2: Use APPDATA\Roaming as fallback
             appdata_roaming = os.environ.get('APPDATA')
             if appdata_roaming:
                 private_dir = os.path.join(appdata_roaming, self.app_name)
-                print(f"🪟 Windows fallback storage: {private_dir}")
+                log.info("🪟 Windows fallback storage: %s", private_dir)
                 return private_dir
             
             # Method 3: Use user profile directory
             user_profile = os.environ.get('USERPROFILE')
             if user_profile:
                 private_dir = os.path.join(user_profile, f".{self.app_name}")
-                print(f"🪟 Windows user profile storage: {private_dir}")
+                log.info("🪟 Windows user profile storage: %s", private_dir)
                 return private_dir
                 
         except Exception as e:
-            print(f"⚠️ Windows directory error: {e}")
+            log.warning("⚠️ Windows directory error: %s", e)
         
         # Fallback
-        return os.path.join(os.path.expanduser("~"), f".{self.app_name}")
+        return os.path.join(self._home, f".{self.app_name}")
     
     def get_macos_private_directory(self):
         """Get macOS app-private directory"""
         try:
             # Method 1: Use Application Support directory (recommended)
-            home = os.path.expanduser("~")
+            home = self._home
             app_support = os.path.join(home, "Library", "Application Support", self.app_name)
-            print(f"🍎 macOS private storage: {app_support}")
+            log.info("🍎 macOS private storage: %s", app_support)
             return app_support
             
         except Exception as e:
-            print(f"⚠️ macOS directory error: {e}")
+            log.warning("⚠️ macOS directory error: %s", e)
             
             # Fallback to hidden directory in home
-            return os.path.join(os.path.expanduser("~"), f".{self.app_name}")
+            return os.path.join(self._home, f".{self.app_name}")
     
     def get_linux_private_directory(self):
         """Get Linux app-private directory"""
@@ -145,83 +284,84 @@ class SecureStorage:
             if xdg_data:
                 private_dir = os.path.join(xdg_data, self.app_name)
             else:
-                home = os.path.expanduser("~")
+                home = self._home
                 private_dir = os.path.join(home, ".local", "share", self.app_name)
             
-            print(f"🐧 Linux private storage: {private_dir}")
+            log.info("🐧 Linux private storage: %s", private_dir)
             return private_dir
             
         except Exception as e:
-            print(f"⚠️ Linux directory error: {e}")
+            log.warning("⚠️ Linux directory error: %s", e)
             
             # Fallback to hidden directory in home
-            return os.path.join(os.path.expanduser("~"), f".{self.app_name}")
+            return os.path.join(self._home, f".{self.app_name}")
     
     def ensure_secure_directories(self):
         """Create all necessary secure directories with proper permissions"""
-        directories = [
-            self.base_dir,
-            self.vault_dir,
-            self.recycle_dir,
-            self.config_dir,
-            os.path.join(self.vault_dir, "photos"),
-            os.path.join(self.vault_dir, "videos"),
-            os.path.join(self.vault_dir, "notes"),
-            os.path.join(self.vault_dir, "audio"),
-            os.path.join(self.vault_dir, "documents"),
-            os.path.join(self.vault_dir, "apps"),
-            os.path.join(self.vault_dir, "other"),
-            os.path.join(self.recycle_dir, "photos"),
-            os.path.join(self.recycle_dir, "videos"),
-            os.path.join(self.recycle_dir, "notes"),
-            os.path.join(self.recycle_dir, "audio"),
-            os.path.join(self.recycle_dir, "documents"),
-            os.path.join(self.recycle_dir, "apps"),
-            os.path.join(self.recycle_dir, "other"),
-            os.path.join(self.recycle_dir, "thumbnails")
-        ]
-        
-        for directory in directories:
-            try:
-                if not os.path.exists(directory):
-                    os.makedirs(directory, mode=0o700)  # Owner read/write/execute only
-                    print(f"📁 Created secure directory: {directory}")
-                else:
-                    # Ensure proper permissions on existing directories
-                    self.set_secure_permissions(directory)
-                    
-            except Exception as e:
-                print(f"❌ Error creating directory {directory}: {e}")
+        ensure_directory = self._ensure_directory
+        
+        # base/vault/recycle/config come first in _all_subdirs and must exist before their children
+        parents = self._all_subdirs[:4]
+        children = self._all_subdirs[4:]
+        
+        first_run = ensure_directory(parents[0])
+        for directory in parents[1:]:
+            ensure_directory(directory)
+        
+        if first_run:
+            # Nothing exists yet: overlap the mkdir/chmod round-trips of the per-type folders
+            from concurrent.futures import ThreadPoolExecutor
+            
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(ensure_directory, children))
+        else:
+            # Usually all present already - a serial pass of failing mkdirs is cheaper than a pool
+            for directory in children:
+                ensure_directory(directory)
+    
+    def _ensure_directory(self, directory):
+        """Create one secure directory, returns True if it was created"""
+        try:
+            # Let makedirs report existing directories instead of probing first
+            os.makedirs(directory, mode=0o700)  # Owner read/write/execute only
+            self.set_secure_permissions(directory)
+            log.debug("📁 Created secure directory: %s", directory)
+            return True
+            
+        except FileExistsError:
+            # Only touch existing directories when explicitly requested
+            if self._verify_existing_perms:
+                self.set_secure_permissions(directory)
+            
+        except Exception as e:
+            log.error("❌ Error creating directory %s: %s", directory, e)
+        
+        return False
     
     def set_secure_permissions(self, path):
         """Set secure permissions on files/directories"""
         try:
-            if not ANDROID:  # Android handles permissions differently
+            if _IS_WINDOWS:
+                # chmod only toggles the read-only flag on Windows, so just hide the path
+                _hide_path(path)
+                
+            elif not ANDROID:  # Android handles permissions differently
                 # Set to 700 (owner only: read, write, execute)
                 os.chmod(path, 0o700)
-                
-                # On Windows, also hide the directory
-                if platform.system() == "Windows":
-                    try:
-                        import ctypes
-                        # Set hidden attribute on Windows
-                        ctypes.windll.kernel32.SetFileAttributesW(path, 0x02)
-                    except:
-                        pass
                         
         except Exception as e:
-            print(f"⚠️ Warning: Could not set secure permissions on {path}: {e}")
+            log.warning("⚠️ Warning: Could not set secure permissions on %s: %s", path, e)
     
     def get_vault_directory(self, file_type=None):
         """Get vault directory for specific file type"""
         if file_type:
-            return os.path.join(self.vault_dir, file_type)
+            return self._vault_dirs.get(file_type) or os.path.join(self.vault_dir, file_type)
         return self.vault_dir
     
     def get_recycle_directory(self, file_type=None):
         """Get recycle directory for specific file type"""
         if file_type:
-            return os.path.join(self.recycle_dir, file_type)
+            return self._recycle_dirs.get(file_type) or os.path.join(self.recycle_dir, file_type)
         return self.recycle_dir
     
     def get_config_directory(self):
@@ -241,24 +381,24 @@ class SecureStorage:
             if not filename:
                 filename = os.path.basename(source_path)
             
-            target_path = os.path.join(target_dir, filename)
-            
-            # Handle filename conflicts
-            counter = 1
-            original_target = target_path
-            while os.path.exists(target_path):
-                name, ext = os.path.splitext(original_target)
-                target_path = f"{name}_{counter}{ext}"
-                counter += 1
+            # Reserve a free target name (handles filename conflicts)
+            target_path = self._reserve_target_path(os.path.join(target_dir, filename))
             
             # Copy file to secure location
-            import shutil
-            shutil.copy2(source_path, target_path)
+            try:
+                _copy_file_data(source_path, target_path)
+            except Exception:
+                # Don't leave the empty placeholder behind
+                os.remove(target_path)
+                raise
             
             # Set secure permissions
             self.set_secure_permissions(target_path)
             
-            print(f"✅ File stored securely: {target_path}")
+            # Stored file changes the totals
+            self._storage_usage_snapshot = (None, 0.0, None)
+            
+            log.debug("✅ File stored securely: %s", target_path)
             
             return {
                 "success": True,
@@ -267,29 +407,60 @@ class SecureStorage:
             }
             
         except Exception as e:
-            print(f"❌ Error storing file securely: {e}")
+            log.error("❌ Error storing file securely: %s", e)
             return {"success": False, "error": str(e)}
     
-    def is_user_accessible(self):
-        """Check if the storage location is easily accessible to users"""
-        # These directories should NOT be easily browsable by users
-        user_accessible_patterns = [
-            "/sdcard",
-            "/storage/emulated/0",
-            os.path.expanduser("~/Desktop"),
-            os.path.expanduser("~/Documents"),
-            os.path.expanduser("~/Downloads"),
-            os.getcwd()  # Current working directory
-        ]
+    def store_files_bulk(self, items):
+        """
+        Store many files securely, overlapping their I/O on a thread pool
         
-        for pattern in user_accessible_patterns:
-            if self.base_dir.startswith(pattern):
-                return True
+        Args:
+            items: iterable of (source_path, file_type) or (source_path, file_type, filename)
         
-        return False
+        Returns:
+            list: store_file_securely() result dicts, in the same order as items
+        """
+        items = list(items)
+        if not items:
+            return []
+        
+        from concurrent.futures import ThreadPoolExecutor
+        
+        max_workers = min(32, (os.cpu_count() or 1) * 4, len(items))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(lambda item: self.store_file_securely(*item), items))
+    
+    def _reserve_target_path(self, target_path):
+        """
+        Atomically create an empty file at target_path, or at a randomly
+        suffixed name if it is taken, and return the path that was created
+        """
+        flags = os.O_CREAT | os.O_EXCL | os.O_WRONLY
+        name, ext = os.path.splitext(target_path)
+        candidate = target_path
+        
+        # One attempt at the requested name, then a few random suffixes
+        for attempt in range(4):
+            try:
+                os.close(os.open(candidate, flags, 0o600))
+                return candidate
+            except FileExistsError:
+                candidate = f"{name}_{os.urandom(4).hex()}{ext}"
+        
+        raise FileExistsError(f"Could not find a free filename for {target_path}")
     
-    def get_storage_info(self):
-        """Get information about the secure storage"""
+    def is_user_accessible(self):
+        """Check if the storage location is easily accessible to users"""
+        return self._is_user_accessible_cache
+    
+    def get_storage_info(self, include_usage=False):
+        """
+        Get information about the secure storage
+        
+        Cheap by default: reports free disk space from a single filesystem query.
+        Pass include_usage=True to also get total_files / total_size_mb, which
+        need a (cached) walk of the whole vault.
+        """
         info = {
             "platform": self.get_platform_name(),
             "base_directory": self.base_dir,
@@ -298,37 +469,130 @@ class SecureStorage:
             "recycle_directory": self.recycle_dir,
             "config_directory": self.config_dir,
             "permissions": "0o700 (owner only)" if not ANDROID else "Android app-private",
-            "hidden": platform.system() == "Windows"
+            "hidden": _IS_WINDOWS
         }
         
-        # Add size information
+        # Free space comes from statvfs (or the Windows equivalent), no directory walk
+        try:
+            import shutil
+            info["free_space_mb"] = round(shutil.disk_usage(self.base_dir).free / (1024 * 1024), 2)
+        except OSError as e:
+            info["free_space_mb"] = "Unknown"
+            log.warning("⚠️ Could not get free disk space: %s", e)
+        
+        if include_usage:
+            info.update(self.get_storage_usage())
+        
+        return info
+    
+    def get_storage_usage(self):
+        """
+        Get file count and total size of everything in the secure storage
+        
+        Returns a cached read-only mapping; callers must not modify it
+        """
+        usage = self._get_cached_storage_usage()
+        if usage is not None:
+            return usage
+        
+        # Serialize recomputation so concurrent callers on a stale cache walk the vault once
+        with self._usage_compute_lock:
+            # Another thread may have refreshed the cache while we waited
+            usage = self._get_cached_storage_usage()
+            if usage is not None:
+                return usage
+            
+            # Taken before the walk, so changes made during it invalidate the result
+            signature = self._storage_signature()
+            usage = types.MappingProxyType(self._compute_storage_usage())
+            self._storage_usage_snapshot = (usage, time.time(), signature)
+        
+        return usage
+    
+    def _get_cached_storage_usage(self):
+        """Get the cached storage usage if it is still valid, otherwise None"""
+        usage, cached_at, signature = self._storage_usage_snapshot
+        if usage is None:
+            return None
+        
+        age = time.time() - cached_at
+        if age < self._storage_usage_cache_ttl:
+            return usage
+        
+        # Past the TTL a few stat calls on the directories are much cheaper than a new walk
+        if age < self._storage_usage_max_age and self._storage_signature() == signature:
+            return usage
+        return None
+    
+    def _storage_signature(self):
+        """Get the mtimes of every storage directory, used to tell if the vault changed"""
+        # Files live in the per-type directories, whose mtime changes on every add/remove/rename
+        signature = []
+        append = signature.append
+        stat = os.stat
+        
+        for directory in self._all_subdirs:
+            try:
+                append(stat(directory).st_mtime_ns)
+            except OSError:
+                append(None)
+        
+        return tuple(signature)
+    
+    def _compute_storage_usage(self):
+        """Walk the vault and build the storage usage dict"""
+        usage = {}
+        
         try:
             total_size = 0
             file_count = 0
             
-            for root, dirs, files in os.walk(self.base_dir):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if os.path.exists(file_path):
-                        total_size += os.path.getsize(file_path)
-                        file_count += 1
+            for entry in self._iter_file_entries():
+                total_size += entry.stat(follow_symlinks=False).st_size
+                file_count += 1
             
-            info["total_files"] = file_count
-            info["total_size_mb"] = round(total_size / (1024 * 1024), 2)
+            usage["total_files"] = file_count
+            usage["total_size_mb"] = round(total_size / (1024 * 1024), 2)
             
         except Exception as e:
-            info["total_files"] = "Unknown"
-            info["total_size_mb"] = "Unknown"
-            print(f"⚠️ Could not calculate storage size: {e}")
+            usage["total_files"] = "Unknown"
+            usage["total_size_mb"] = "Unknown"
+            log.warning("⚠️ Could not calculate storage size: %s", e)
         
-        return info
+        return usage
+    
+    def _iter_file_entries(self):
+        """Iterate over all files under the base directory as os.DirEntry objects"""
+        # Iterative walk using scandir only, so type and size come from the cached dirent data.
+        # Symlinks are never followed: nothing in the vault should point outside of it.
+        scandir = os.scandir
+        stack = [self.base_dir]
+        pop = stack.pop
+        push = stack.append
+        
+        while stack:
+            with scandir(pop()) as entries:
+                for entry in entries:
+                    if entry.is_symlink():
+                        log.warning("⚠️ Skipping symlink in secure storage: %s", entry.path)
+                    elif entry.is_dir(follow_symlinks=False):
+                        push(entry.path)
+                    elif entry.is_file(follow_symlinks=False):
+                        yield entry
     
     def verify_security(self):
         """Verify that the storage is properly secured"""
         issues = []
         
+        # A single stat answers both "does it exist" and "what are its permissions".
+        # Like os.path.exists(), it follows symlinks and treats any OSError as missing.
+        try:
+            stat_info = os.stat(self.base_dir)
+        except OSError:
+            stat_info = None
+        
         # Check if directory exists
-        if not os.path.exists(self.base_dir):
+        if stat_info is None:
             issues.append("Base directory does not exist")
         
         # Check if it's in a user-accessible location
@@ -337,13 +601,12 @@ class SecureStorage:
         
         # Check permissions (non-Android only)
         if not ANDROID:
-            try:
-                stat_info = os.stat(self.base_dir)
-                permissions = oct(stat_info.st_mode)[-3:]
-                if permissions != "700":
-                    issues.append(f"Insecure permissions: {permissions} (should be 700)")
-            except:
+            if stat_info is None:
                 issues.append("Could not check permissions")
+            else:
+                permissions = stat_info.st_mode & 0o777
+                if permissions != 0o700:
+                    issues.append(f"Insecure permissions: {permissions:o} (should be 700)")
         
         return {
             "is_secure": len(issues) == 0,
@@ -353,19 +616,23 @@ class SecureStorage:
     
     def get_security_recommendations(self):
         """Get security recommendations based on current setup"""
+        return list(self._security_recommendations)
+    
+    def _compute_security_recommendations(self):
+        """Build the security recommendations tuple (called once from __init__)"""
         recommendations = []
         
         if self.is_user_accessible():
             recommendations.append("Consider using app-private storage location")
         
-        if not ANDROID and platform.system() != "Windows":
+        if not ANDROID and not _IS_WINDOWS:
             recommendations.append("Ensure file permissions are set to 700 (owner only)")
         
         recommendations.append("Consider encrypting files before storing them")
         recommendations.append("Implement user authentication (PIN/password)")
         recommendations.append("Regular security audits of stored files")
         
-        return recommendations
+        return tuple(recommendations)
 
 # Update the RecycleBinCore to use secure storage
 def update_recycle_bin_for_secure_storage(recycle_bin_core, secure_storage):
@@ -378,8 +645,8 @@ def update_recycle_bin_for_secure_storage(recycle_bin_core, secure_storage):
     # Ensure directories exist
     secure_storage.ensure_secure_directories()
     
-    print("✅ RecycleBin updated to use secure storage")
-    print(f"📁 New recycle directory: {recycle_bin_core.recycle_dir}")
+    log.info("✅ RecycleBin updated to use secure storage")
+    log.info("📁 New recycle directory: %s", recycle_bin_core.recycle_dir)
 
 # Example usage and testing
 def test_secure_storage():
@@ -390,7 +657,7 @@ def test_secure_storage():
     storage = SecureStorage("SecretVault")
     
     # Get storage info
-    info = storage.get_storage_info()
+    info = storage.get_storage_info(include_usage=True)
     print(f"\n📋 Storage Information:")
     for key, value in info.items():
         print(f"   {key}: {value}")
@@ -407,5 +674,6 @@ def test_secure_storage():
     print("\n✅ Secure storage test completed")
     return storage
 
-if __name__ == "__main__":
+if __name__ == "__main__" and "--test" in sys.argv:
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     test_secure_storage()
\ No newline at end of file
@@ -6,6 +6,7 @@ Much simpler than the original complex version.
 
 from secure_storage import SecureStorage
 import os
+import errno
 import shutil
 
 def setup_secure_vault(vault_app):
@@ -54,8 +55,11 @@ def migrate_existing_files(vault_app):
     print("📦 Migrating existing files to secure storage...")
     migrated_count = 0
     
+    # The old (pre secure storage) folders all lived in the working directory
+    cwd = os.getcwd()
+    
     # Migrate photos
-    old_photo_dir = os.path.join(os.getcwd(), 'vault_photos')
+    old_photo_dir = os.path.join(cwd, 'vault_photos')
     new_photo_dir = vault_app.secure_storage.get_vault_directory('photos')
     
     if os.path.exists(old_photo_dir) and old_photo_dir != new_photo_dir:
@@ -65,7 +69,7 @@ def migrate_existing_files(vault_app):
         print(f"📸 Migrated {migrated} photos")
     
     # Migrate videos
-    old_video_dir = os.path.join(os.getcwd(), 'vault_videos')
+    old_video_dir = os.path.join(cwd, 'vault_videos')
     new_video_dir = vault_app.secure_storage.get_vault_directory('videos')
     
     if os.path.exists(old_video_dir) and old_video_dir != new_video_dir:
@@ -84,22 +88,27 @@ def migrate_existing_files(vault_app):
             print(f"🖼️ Migrated {thumb_migrated} thumbnails")
     
     # Migrate recycle bin
-    old_recycle_dir = os.path.join(os.getcwd(), 'vault_recycle')
+    old_recycle_dir = os.path.join(cwd, 'vault_recycle')
     new_recycle_dir = vault_app.secure_storage.get_recycle_directory()
     
     if os.path.exists(old_recycle_dir) and old_recycle_dir != new_recycle_dir:
         # Copy entire recycle structure
         try:
-            if os.listdir(old_recycle_dir):  # If not empty
-                for item in os.listdir(old_recycle_dir):
-                    old_path = os.path.join(old_recycle_dir, item)
-                    new_path = os.path.join(new_recycle_dir, item)
+            # One listing gives names and types; read it fully before moving entries out
+            with os.scandir(old_recycle_dir) as entries:
+                items = list(entries)
+            
+            if items:  # If not empty
+                for entry in items:
+                    old_path = entry.path
+                    new_path = os.path.join(new_recycle_dir, entry.name)
                     
-                    if os.path.isfile(old_path):
-                        shutil.move(old_path, new_path)
+                    if entry.is_file(follow_symlinks=False):
+                        _move_file(old_path, new_path)
                         migrated_count += 1
-                    elif os.path.isdir(old_path):
+                    elif entry.is_dir(follow_symlinks=False):
                         if not os.path.exists(new_path):
+                            # Whole folder in one rename (shutil.move only copies across filesystems)
                             shutil.move(old_path, new_path)
                         else:
                             # Merge directories
@@ -123,27 +132,71 @@ def migrate_folder(source_dir, target_dir, extensions):
     """Helper function to migrate files from source to target"""
     migrated = 0
     
+    # str.endswith takes a tuple, so the filter is one C-level call per file
+    extensions = tuple(ext.lower() for ext in extensions)
+    
     try:
-        for filename in os.listdir(source_dir):
-            source_path = os.path.join(source_dir, filename)
-            
-            if os.path.isfile(source_path):
+        moves = []
+        duplicates = 0
+        
+        # Names in the target, plus the ones handed out below, so conflicts are resolved
+        # in memory instead of with a stat per candidate. Lowercased to stay safe on
+        # case-insensitive filesystems (Windows, macOS).
+        with os.scandir(target_dir) as entries:
+            taken = {entry.name.lower() for entry in entries}
+        
+        # Target paths are built by plain concatenation instead of an os.path.join per file
+        target_prefix = os.path.join(target_dir, "")
+        
+        # scandir hands out name, path and file type without a stat per entry
+        with os.scandir(source_dir) as entries:
+            for entry in entries:
+                if not entry.is_file(follow_symlinks=False):
+                    continue
+                
+                filename = entry.name
+                
                 # Check extension if specified
-                if extensions and not any(filename.lower().endswith(ext) for ext in extensions):
+                if extensions and not filename.lower().endswith(extensions):
                     continue
                 
-                target_path = os.path.join(target_dir, filename)
+                # Already migrated (e.g. an interrupted run copied it but kept the source)
+                if filename.lower() in taken and _is_migrated_copy(entry, target_prefix + filename):
+                    try:
+                        os.unlink(entry.path)
+                        duplicates += 1
+                        continue
+                    except OSError:
+                        pass  # Fall back to migrating it under a new name
                 
                 # Handle filename conflicts
+                target_name = filename
                 counter = 1
-                original_target = target_path
-                while os.path.exists(target_path):
-                    name, ext = os.path.splitext(original_target)
-                    target_path = f"{name}_migrated_{counter}{ext}"
+                while target_name.lower() in taken:
+                    name, ext = os.path.splitext(filename)
+                    target_name = f"{name}_migrated_{counter}{ext}"
                     counter += 1
                 
-                shutil.move(source_path, target_path)
-                migrated += 1
+                taken.add(target_name.lower())
+                moves.append((entry.path, target_prefix + target_name))
+        
+        if moves:
+            # Targets are fixed above, so the moves are independent - overlap their I/O on a pool
+            from concurrent.futures import ThreadPoolExecutor
+            
+            max_workers = min(32, (os.cpu_count() or 1) * 4, len(moves))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                errors = list(executor.map(_safe_move, moves))
+            
+            # One summary line instead of a print per failed file
+            failures = [(source_path, error) for (source_path, _), error in zip(moves, errors) if error]
+            migrated = len(moves) - len(failures)
+            if failures:
+                first_path, first_error = failures[0]
+                print(f"⚠️ Failed to move {len(failures)} file(s) from {source_dir} "
+                      f"(first: {first_path}: {first_error})")
+        
+        migrated += duplicates
         
         # Remove source directory if empty
         try:
@@ -157,6 +210,71 @@ def migrate_folder(source_dir, target_dir, extensions):
     
     return migrated
 
+def _move_file(source_path, target_path):
+    """Move a file with a single rename when possible, copying only across filesystems"""
+    try:
+        # os.replace overwrites an existing target on Windows too, like shutil.move did
+        os.replace(source_path, target_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        # Different filesystem/drive: copy data and timestamps, then drop the source
+        if hasattr(os, "posix_fadvise"):
+            _copy_sequential(source_path, target_path)
+            shutil.copystat(source_path, target_path)
+        else:
+            shutil.copy2(source_path, target_path)
+        
+        # Never delete the only copy unless the target really holds all of it
+        source_size = os.stat(source_path).st_size
+        target_size = os.stat(target_path).st_size
+        if target_size != source_size:
+            os.remove(target_path)  # Don't leave a partial file in the vault
+            raise OSError(f"Incomplete copy of {source_path}: {target_size} of {source_size} bytes")
+        os.unlink(source_path)
+
+def _copy_sequential(source_path, target_path):
+    """Copy file contents, telling the kernel the source is read front to back (POSIX only)"""
+    with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+        # Let the kernel read ahead aggressively - migration copies every file in full
+        os.posix_fadvise(src.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        
+        offset = 0
+        try:
+            # In-kernel copy from the hinted fd (file to file works on Linux)
+            while True:
+                sent = os.sendfile(dst.fileno(), src.fileno(), offset, 1 << 23)
+                if sent == 0:
+                    return
+                offset += sent
+        except (AttributeError, OSError):
+            if offset:
+                raise  # Part of the file is already written - let the caller clean up
+        
+        # No sendfile for regular files here (e.g. BSDs) - plain buffered copy
+        shutil.copyfileobj(src, dst, 1024 * 1024)
+
+def _is_migrated_copy(entry, target_path):
+    """Check if target_path matches the source DirEntry's mode, size and mtime (as copystat leaves it)"""
+    try:
+        source_stat = entry.stat(follow_symlinks=False)
+        target_stat = os.stat(target_path, follow_symlinks=False)
+    except OSError:
+        return False
+    
+    return (source_stat.st_mode == target_stat.st_mode
+            and source_stat.st_size == target_stat.st_size
+            and int(source_stat.st_mtime) == int(target_stat.st_mtime))
+
+def _safe_move(paths):
+    """Move a (source_path, target_path) pair, returns None or the error message"""
+    source_path, target_path = paths
+    try:
+        _move_file(source_path, target_path)
+        return None
+    except OSError as e:
+        return str(e)
+
 # Helper functions for vault modules to use
 def get_secure_directory(vault_app, dir_type):
     """
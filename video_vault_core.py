@@ -157,6 +157,9 @@ def kill_explorer_thumbnails():
 class VideoVaultCore:
     """Core video vault functionality with proper file handle management"""
     
+    # Extensions listed as videos in the vault
+    VIDEO_EXTENSIONS = ('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.3gp', '.ogg', '.ogv')
+    
     def __init__(self, app_instance):
         self.app = app_instance
         self.vault_dir = self.get_vault_directory()
@@ -164,6 +167,7 @@ class VideoVaultCore:
         self.processing = False  # Flag to prevent multiple operations
         self.active_video_players = []  # Track active video players for cleanup
         self.cv2_captures = []  # Track OpenCV VideoCapture objects
+        self._video_list_cache = (None, [])  # (vault folder signature, sorted video paths)
         
     def get_vault_directory(self):
         """Get the secure directory for storing vault videos"""
@@ -436,13 +440,43 @@ class VideoVaultCore:
     
     def get_vault_videos(self):
         """Get list of all videos in vault"""
-        videos = []
         try:
-            if os.path.exists(self.vault_dir):
-                for filename in os.listdir(self.vault_dir):
-                    if filename.lower().endswith(('.mp4', '.avi', '.mov', '.mkv', '.wmv', '.flv', '.webm', '.3gp', '.ogg', '.ogv')):
-                        videos.append(os.path.join(self.vault_dir, filename))
-            return sorted(videos, key=lambda x: os.path.getmtime(x) if os.path.exists(x) else 0, reverse=True)
+            # The folder's mtime changes whenever a video is added, removed or renamed
+            try:
+                dir_stat = os.stat(self.vault_dir)
+            except FileNotFoundError:
+                return []
+            signature = (dir_stat.st_mtime_ns, dir_stat.st_size)
+            cached_signature, cached_videos = self._video_list_cache
+            if signature == cached_signature:
+                return list(cached_videos)
+            
+            # A folder changed within the last 2s may still be mid-copy (or on a filesystem with
+            # coarse timestamps), and finishing a write doesn't touch its mtime - don't cache it
+            cacheable = time.time() - dir_stat.st_mtime >= 2
+            
+            # scandir keeps the stat with each entry, so sorting needs no extra exists/getmtime calls
+            try:
+                entries = os.scandir(self.vault_dir)
+            except FileNotFoundError:
+                return []
+            
+            videos = []
+            with entries:
+                for entry in entries:
+                    if not entry.name.lower().endswith(self.VIDEO_EXTENSIONS):
+                        continue
+                    try:
+                        mtime = entry.stat().st_mtime
+                    except OSError:
+                        continue  # Deleted or recycled while listing
+                    videos.append((mtime, entry.path))
+            
+            videos.sort(key=lambda item: item[0], reverse=True)
+            videos = [path for _, path in videos]
+            
+            self._video_list_cache = (signature, videos) if cacheable else (None, [])
+            return list(videos)
         except Exception as e:
             print(f"Error getting vault videos: {e}")
             return []
@@ -698,6 +732,8 @@ class VideoVaultCore:
             print("🔄 Falling back to permanent deletion...")
             # Fallback to aggressive deletion on any error
             return self.delete_video_permanent_fallback(video_path)
+        finally:
+            self._video_list_cache = (None, [])
     
     def open_video_externally(self, video_path):
         """Open video with system default player"""
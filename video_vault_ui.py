@@ -262,6 +262,7 @@ Continue?"""
     def finish_import(self, imported_files, callback, moved_files):
         """Finish import process on main thread"""
         self.processing = False
+        self._video_list_cache = (None, [])  # Copies finished after the last listing
         if imported_files:
             callback(imported_files, moved_files)
     
@@ -964,19 +965,24 @@ def cleanup_temp_files():
 def get_vault_statistics(vault_instance):
     """Get statistics about the video vault"""
     try:
-        videos = vault_instance.get_vault_videos()
+        video_extensions = vault_instance.VIDEO_EXTENSIONS
+        video_count = 0
         total_size = 0
         
-        for video_path in videos:
-            try:
-                total_size += os.path.getsize(video_path)
-            except:
-                pass
+        # One scandir pass: sizes come from the directory entries instead of a getsize per video
+        with os.scandir(vault_instance.vault_dir) as entries:
+            for entry in entries:
+                if entry.name.lower().endswith(video_extensions):
+                    try:
+                        total_size += entry.stat().st_size
+                    except OSError:
+                        continue
+                    video_count += 1
         
         total_size_mb = round(total_size / (1024 * 1024), 1)
         
         return {
-            'video_count': len(videos),
+            'video_count': video_count,
             'total_size_mb': total_size_mb,
             'vault_directory': vault_instance.vault_dir
         }